@@ -11,8 +11,17 @@ from .cli import cli
 from .error import error_handler, ErrorCategory
 from .api import close_global_api
 
+def install_event_loop_policy():
+    """Use uvloop for all asyncio.run calls when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 def main():
     """Main entry point with error handling."""
+    install_event_loop_policy()
     try:
         # Run the CLI
         cli(obj={})
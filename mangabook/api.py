@@ -23,6 +23,7 @@ class MangaDexAPI:
         """Initialize the MangaDex API wrapper."""
         self.auth_manager = AuthManager()
         self._client = None
+        self._manga_cache: Dict[str, Dict[str, Any]] = {}
     
     async def _get_client(self):
         """Get an authenticated MangaDex client.
@@ -95,6 +96,11 @@ class MangaDexAPI:
             AuthenticationError: If authentication fails.
             Exception: If the API request fails.
         """
+        # Manga details are constant for a session, so each ID is fetched once
+        cached = self._manga_cache.get(manga_id)
+        if cached is not None:
+            return cached
+        
         client = await self._get_client()
         
         # Build query parameters
@@ -106,7 +112,11 @@ class MangaDexAPI:
         # Use direct HTTP request instead of client.manga.get
         await client._ensure_session()
         async with client.session.get(f"{client.base_url}{url}", params=params) as response:
-            return await response.json()
+            manga_data = await response.json()
+        
+        if manga_data.get("result") == "ok":
+            self._manga_cache[manga_id] = manga_data
+        return manga_data
     
     @exception_handler
     @retry(max_attempts=3, delay=1.0, backoff=2.0)
@@ -18,7 +18,7 @@ from datetime import datetime
 from .api import get_api, MangaDexAPI
 from .utils import (
     create_table, 
-    truncate_string, 
+    make_truncator,
     clean_html, 
     format_manga_title,
     format_volume_number,
@@ -131,6 +131,8 @@ def display_manga_search_results(results: List[Dict[str, Any]], page: int = 1, l
     # Prepare table data
     headers = ["#", "Title", "Original Language", "Available Languages", "Status", "Year", "ID"]
     rows = []
+    truncate_title = make_truncator(50)
+    truncate_langs = make_truncator(20)
     
     for i, manga in enumerate(results):
         # Format available languages list
@@ -142,9 +144,9 @@ def display_manga_search_results(results: List[Dict[str, Any]], page: int = 1, l
         
         rows.append([
             str(item_num),
-            truncate_string(manga.get("title", "Unknown"), 50),
+            truncate_title(manga.get("title", "Unknown")),
             manga.get("original_language", "unknown"),
-            truncate_string(langs_str, 20),
+            truncate_langs(langs_str),
             manga.get("status", "unknown"),
             str(manga.get("year", "N/A")),
             manga.get("id", "N/A"),
@@ -1268,6 +1270,8 @@ async def check_command(path: Optional[str] = None, full: bool = False) -> None:
         for package, status in env.get("dependencies", {}).items():
             if status.get("installed", False):
                 click.secho(f"✅ {package} is installed", fg="green")
+                if full and status.get("version"):
+                    click.echo(f"  Version: {status['version']}")
             else:
                 click.secho(f"❌ {package} is not installed", fg="red")
         
@@ -32,7 +32,8 @@ from .utils import (
     load_manifest,
     update_manifest_chapter,
     update_manifest_page,
-    validate_chapter_files
+    validate_chapter_files,
+    write_file_bytes
 )
 from .config import Config
 from .parallel import DownloadManager, ApiCache, gather_with_concurrency
@@ -81,7 +82,12 @@ class ChapterDownloader:
             self._api_created_internally = False
         
         if self.session is None:
-            self.session = aiohttp.ClientSession()
+            # Keep idle connections open longer than aiohttp's default 15s so
+            # the next chapter on the same image server reuses them instead of
+            # repeating the TLS handshake
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(keepalive_timeout=60)
+            )
         
         # If no output directory specified, get from config
         if not self.output_dir:
@@ -161,12 +167,12 @@ class ChapterDownloader:
                     logger.error(f"Failed to download image: HTTP {response.status}")
                     return False
                 
-                # Ensure the directory exists
-                path.parent.mkdir(parents=True, exist_ok=True)
+                data = await response.read()
                 
-                # Save the file
-                with open(path, "wb") as f:
-                    f.write(await response.read())
+                # Save the file off the event loop so other downloads keep
+                # flowing; its directory is created if missing
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, write_file_bytes, path, data)
                 
                 return True
         except Exception as e:
@@ -11,6 +11,7 @@ import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Union, Set
 import io
+import zipfile
 from collections import OrderedDict
 
 import ebooklib
@@ -64,6 +65,25 @@ img {
 """
 
 
+# Image formats that are already compressed; deflating them again costs CPU
+# and saves next to nothing, so they are stored as-is in the EPUB zip
+PRECOMPRESSED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp"})
+
+
+def zip_compress_type(filename: Union[str, Path]) -> int:
+    """Pick the zip compression method for an EPUB entry.
+    
+    Args:
+        filename: Name or path of the entry.
+        
+    Returns:
+        int: zipfile.ZIP_STORED for pre-compressed images, else zipfile.ZIP_DEFLATED.
+    """
+    if os.path.splitext(filename)[1].lower() in PRECOMPRESSED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
 class EPUBBuilder:
     """Builds EPUB files from manga images."""
     
@@ -89,6 +109,7 @@ class EPUBBuilder:
         
         self.book = None
         self.images = []
+        self._image_filenames = set()
         self.chapters = OrderedDict()
         self.toc = []
         self.cover_image = None
@@ -207,7 +228,7 @@ class EPUBBuilder:
             image_filename = f"images/{chapter_id}/{image_count:03d}_{image_path.name}"
             
             # Check if this image already exists in the book
-            if any(item.file_name == image_filename for item in self.images):
+            if image_filename in self._image_filenames:
                 logger.warning(f"Image with filename {image_filename} already exists, generating unique name")
                 image_filename = f"images/{chapter_id}/{image_count:03d}_{uuid.uuid4().hex[:8]}_{image_path.name}"
             
@@ -226,12 +247,13 @@ class EPUBBuilder:
                 uid=image_uid,
                 file_name=image_filename,
                 media_type=media_type,
-                content=open(image_path, 'rb').read()
+                content=image_path.read_bytes()
             )
             
             # Add the item to the book
             self.book.add_item(image_item)
             self.images.append(image_item)
+            self._image_filenames.add(image_filename)
             
             # Create a page for the image with unique ID
             page_uid = f"{chapter_id}_{image_count:03d}"
@@ -21,7 +21,7 @@ import ebooklib
 from ebooklib import epub
 
 from ..utils import ensure_directory, sanitize_filename
-from .builder import EPUBBuilder
+from .builder import EPUBBuilder, zip_compress_type
 from .kobo import KepubBuilder
 
 # Set up logging
@@ -147,7 +147,8 @@ class EnhancedEPUBBuilder(EPUBBuilder):
                         arc_name = arc_name.replace(os.path.sep, '/')
                         
                         # Add the file to the ZIP
-                        zip_file.write(file_path, arcname=arc_name)
+                        zip_file.write(file_path, arcname=arc_name,
+                                       compress_type=zip_compress_type(file))
         
         logger.info(f"EPUB written to {epub_path}")
         return str(epub_path)
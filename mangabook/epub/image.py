@@ -93,24 +93,41 @@ class ImageProcessor:
         Returns:
             Tuple[Image.Image, Image.Image]: Left and right parts of the image.
         """
+        left_box, right_box = self.split_boxes(img)
+        
+        return img.crop(left_box), img.crop(right_box)
+    
+    def split_boxes(self, img: Image.Image) -> Tuple[Tuple[int, int, int, int], Tuple[int, int, int, int]]:
+        """Get the left and right halves of a wide image as crop boxes.
+        
+        Args:
+            img: PIL Image object to split.
+            
+        Returns:
+            Tuple: Left and right (left, upper, right, lower) boxes.
+        """
         width, height = img.size
         mid_point = width // 2
         
-        left_part = img.crop((0, 0, mid_point, height))
-        right_part = img.crop((mid_point, 0, width, height))
-        
-        return left_part, right_part
+        return (0, 0, mid_point, height), (mid_point, 0, width, height)
     
-    def resize_image(self, img: Image.Image) -> Image.Image:
+    def resize_image(self, img: Image.Image,
+                     box: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
         """Resize an image to fit the target dimensions.
         
         Args:
             img: PIL Image object to resize.
+            box: Optional region of the image to resize instead of the whole
+                 image; resizing straight from the region avoids an
+                 intermediate cropped copy.
             
         Returns:
             Image.Image: Resized image.
         """
-        width, height = img.size
+        if box is None:
+            width, height = img.size
+        else:
+            width, height = box[2] - box[0], box[3] - box[1]
         img_aspect = height / width
         
         # Determine new dimensions
@@ -125,10 +142,10 @@ class ImageProcessor:
         
         # Don't upscale images that are already smaller
         if width <= self.target_width and height <= self.target_height:
-            return img
+            return img if box is None else img.crop(box)
         
         # Resize using LANCZOS for best quality
-        return img.resize((new_width, new_height), Image.LANCZOS)
+        return img.resize((new_width, new_height), Image.LANCZOS, box=box)
     
     def optimize_image(self, img: Image.Image, format_: str = "JPEG") -> Image.Image:
         """Optimize an image for e-readers.
@@ -174,21 +191,27 @@ class ImageProcessor:
         try:
             with Image.open(source_path) as img:
                 output_paths = []
+                split = self.split_wide_pages and self.is_wide_page(img)
+                
+                # Let the JPEG decoder downscale by a power of two while the
+                # result still covers the target size; LANCZOS does the rest
+                pieces = 2 if split else 1
+                img.draft(img.mode, (self.target_width * pieces, self.target_height))
                 
                 # Check if it's a wide page and needs splitting
-                if self.split_wide_pages and self.is_wide_page(img):
+                if split:
                     logger.debug(f"Splitting wide page: {source_path}")
-                    left, right = self.split_image(img)
+                    left_box, right_box = self.split_boxes(img)
                     
                     # Process left part
-                    left = self.resize_image(left)
+                    left = self.resize_image(img, box=left_box)
                     left = self.optimize_image(left)
                     left_path = out_dir / f"{filename}_left.jpg"
                     left.save(left_path, "JPEG", quality=self.quality, optimize=True)
                     output_paths.append(left_path)
                     
                     # Process right part
-                    right = self.resize_image(right)
+                    right = self.resize_image(img, box=right_box)
                     right = self.optimize_image(right)
                     right_path = out_dir / f"{filename}_right.jpg"
                     right.save(right_path, "JPEG", quality=self.quality, optimize=True)
@@ -225,8 +248,9 @@ class ImageProcessor:
         
         # Find all image files
         extensions = (".jpg", ".jpeg", ".png", ".webp")
-        image_files = [f for f in sorted(source_dir.iterdir()) 
-                      if f.is_file() and f.suffix.lower() in extensions]
+        with os.scandir(source_dir) as entries:
+            image_files = sorted(Path(entry.path) for entry in entries
+                                 if entry.name.lower().endswith(extensions) and entry.is_file())
         
         if not image_files:
             logger.warning(f"No images found in {source_dir}")
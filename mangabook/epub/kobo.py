@@ -22,7 +22,7 @@ from bs4 import BeautifulSoup
 import ebooklib
 from ebooklib import epub
 
-from .builder import EPUBBuilder
+from .builder import EPUBBuilder, zip_compress_type
 from ..utils import sanitize_filename, ensure_directory
 
 # Set up logging
@@ -227,7 +227,8 @@ class KepubBuilder(EPUBBuilder):
                             
                             file_path = root_path / file
                             arcname = file_path.relative_to(temp_dir)
-                            zipf.write(file_path, arcname)
+                            zipf.write(file_path, arcname,
+                                       compress_type=zip_compress_type(file))
                 
                 logger.info(f"Applied Kobo modifications to {filepath}")
         
@@ -12,6 +12,12 @@ from typing import Dict, Any, List, Optional, Set, Union
 from datetime import datetime, timedelta
 import time
 
+# orjson is an optional speedup for history (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import Config
 
 # Set up logging
@@ -55,8 +61,8 @@ class MangaHistory:
             }
         
         try:
-            with open(self.history_file, "r") as f:
-                data = json.load(f)
+            raw = self.history_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             # Ensure structure is valid
             if "manga" not in data:
@@ -102,8 +108,14 @@ class MangaHistory:
                 self.history_data["last_prune"] = datetime.now().isoformat()
         
         try:
-            with open(self.history_file, "w") as f:
-                json.dump(self.history_data, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(
+                    self.history_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                data = json.dumps(self.history_data, indent=2).encode("utf-8")
+            self.history_file.write_bytes(data)
                 
             # Set secure permissions
             os.chmod(self.history_file, 0o600)
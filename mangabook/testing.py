@@ -332,8 +332,10 @@ class EpubTest(TestCase):
         for epub_file in result.get("epub_files", []):
             self.log(f"Generated EPUB: {epub_file}")
             
-            # Validate EPUB
-            validation_result = await validate_epub(epub_file)
+            # Validate EPUB, reusing the result from process_manga when present
+            validation_result = result.get("validation_results", {}).get(epub_file)
+            if validation_result is None:
+                validation_result = await validate_epub(epub_file)
             
             if validation_result.get("valid") is True:
                 self.log(f"EPUB validation: Passed")
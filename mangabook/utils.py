@@ -6,14 +6,23 @@ This module contains common utility functions used throughout the application.
 import os
 import re
 import time
+import threading
 import logging
 import functools
 import html
 import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Callable, Optional, TypeVar, Union, Tuple
 
+# orjson is an optional speedup for manifest (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -28,7 +37,23 @@ POSIX_INVALID_CHARS = re.compile(r'[/\x00]')
 # This includes control characters, spaces and special shell characters
 PROBLEMATIC_CHARS = re.compile(r'[<>:"|?*\\\x00-\x1f\s]')
 
+# Translation tables equivalent to the patterns above. str.translate does the
+# per-character replacement in a single C loop, without the regex engine.
+# The whitespace set mirrors what ``\s`` matches for str patterns.
+_UNICODE_WHITESPACE = (
+    ' \t\n\v\f\r\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004'
+    '\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000'
+)
+_POSIX_TRANS = str.maketrans(dict.fromkeys('/\x00', '_'))
+_PROBLEMATIC_TRANS = str.maketrans(dict.fromkeys(
+    '<>:"|?*\\' + ''.join(chr(i) for i in range(32)) + _UNICODE_WHITESPACE, '_'
+))
+
+# Pattern used by clean_html: a run of tags and/or whitespace collapses to one space
+_TAG_OR_WHITESPACE = re.compile(r'(?:<[^>]+>|\s)+')
+
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename: str, posix_only: bool = False) -> str:
     """Remove invalid characters from a filename for filesystem compatibility.
     
@@ -43,30 +68,72 @@ def sanitize_filename(filename: str, posix_only: bool = False) -> str:
         
     Returns:
         A sanitized filename safe for file system operations.
+    
+    Results are cached, since the same manga and chapter titles are
+    sanitized repeatedly during a download.
     """
     if not filename:
         return "unnamed"
     
-    # Choose which pattern to use based on the posix_only flag
-    pattern = POSIX_INVALID_CHARS if posix_only else PROBLEMATIC_CHARS
+    # Choose which table to use based on the posix_only flag
+    table = _POSIX_TRANS if posix_only else _PROBLEMATIC_TRANS
     
     # Replace invalid characters with underscores
-    sanitized = pattern.sub('_', filename)
+    sanitized = filename.translate(table)
     
     # Trim leading/trailing whitespace and periods
     # (leading dots make files hidden in POSIX systems)
+    # A name made only of dots is stripped to the empty string here
     sanitized = sanitized.strip('. ')
     
-    # Ensure we don't have just dots or empty string
-    if not sanitized or all(c == '.' for c in sanitized):
-        return "unnamed"
+    return sanitized or "unnamed"
+
+
+def sanitize_filenames(filenames: List[str], posix_only: bool = False) -> List[str]:
+    """Sanitize a batch of filenames.
+    
+    Equivalent to calling sanitize_filename on each item, but reuses a single
+    translation table for the whole batch.
+    
+    Args:
+        filenames: The filenames to sanitize.
+        posix_only: If True, only strip characters not allowed in POSIX (/ and null).
+                   If False, also replace other problematic characters (default).
+        
+    Returns:
+        A list of sanitized filenames, in the same order as the input.
+    """
+    table = _POSIX_TRANS if posix_only else _PROBLEMATIC_TRANS
+    return [
+        (name.translate(table).strip('. ') if name else "") or "unnamed"
+        for name in filenames
+    ]
+
+
+# Directories already created by ensure_directory in this process
+_CREATED_DIRS: set = set()
+_CREATED_DIRS_LOCK = threading.Lock()
+
+
+def reset_directory_cache() -> None:
+    """Forget which directories ensure_directory has created.
     
-    return sanitized
+    Called at the start of each run, and in pool workers, so directories
+    removed since they were cached are created again. The set and lock are
+    replaced rather than cleared under the lock: a forked worker may have
+    inherited the lock in its held state from a writer thread in the parent.
+    """
+    global _CREATED_DIRS, _CREATED_DIRS_LOCK
+    _CREATED_DIRS = set()
+    _CREATED_DIRS_LOCK = threading.Lock()
 
 
 def ensure_directory(directory_path: Union[str, Path]) -> Path:
     """Create directory if it doesn't exist.
     
+    Directories already created by this process are remembered, so repeated
+    calls for the same path skip the mkdir syscalls.
+    
     Args:
         directory_path: Path to the directory to create.
         
@@ -77,14 +144,42 @@ def ensure_directory(directory_path: Union[str, Path]) -> Path:
         OSError: If directory creation fails.
     """
     path = Path(directory_path)
+    key = os.fspath(path)
+    if key in _CREATED_DIRS:
+        return path
     try:
         path.mkdir(parents=True, exist_ok=True)
+        # Only remember successful creations, so failures are retried
+        with _CREATED_DIRS_LOCK:
+            _CREATED_DIRS.add(key)
         return path
     except OSError as e:
-        logger.error(f"Failed to create directory {path}: {e}")
+        logger.error("Failed to create directory %s: %s", path, e)
         raise
 
 
+def write_file_bytes(file_path: Union[str, Path], data: bytes) -> None:
+    """Write bytes to a file, creating its directory if needed.
+    
+    If the directory was removed after ensure_directory cached it, the write
+    fails with FileNotFoundError; the directory is then created again and
+    the write retried once.
+    
+    Args:
+        file_path: Path of the file to write.
+        data: Bytes to write.
+    """
+    path = Path(file_path)
+    ensure_directory(path.parent)
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        with _CREATED_DIRS_LOCK:
+            _CREATED_DIRS.discard(os.fspath(path.parent))
+        ensure_directory(path.parent)
+        path.write_bytes(data)
+
+
 def generate_manga_path(base_dir: Union[str, Path], manga_title: str) -> Path:
     """Generate a standardized path for a manga.
     
@@ -98,8 +193,27 @@ def generate_manga_path(base_dir: Union[str, Path], manga_title: str) -> Path:
         Path: The standardized path for the manga.
     """
     safe_title = sanitize_filename(manga_title)
-    manga_path = Path(base_dir) / safe_title
-    return ensure_directory(manga_path)
+    return ensure_directory(Path(base_dir, safe_title))
+
+
+def _pad_number(num_str: str, width: int) -> str:
+    """Zero-pad the integer part of a formatted volume or chapter number.
+    
+    Args:
+        num_str: Number as returned by format_volume_number (e.g. "3", "12.5").
+        width: Minimum number of digits for the integer part.
+        
+    Returns:
+        The padded number (e.g. "003", "0012.5"), or num_str unchanged if it
+        is not a plain decimal number.
+    """
+    int_part, sep, frac = num_str.partition('.')
+    digits = int_part[1:] if int_part.startswith('-') else int_part
+    if not (digits.isascii() and digits.isdigit()):
+        return num_str
+    if sep and not (frac.isascii() and frac.isdigit()):
+        return num_str
+    return int_part.zfill(width) + sep + frac
 
 
 def generate_volume_path(manga_path: Union[str, Path], volume_number: Union[str, int, float]) -> Path:
@@ -117,32 +231,16 @@ def generate_volume_path(manga_path: Union[str, Path], volume_number: Union[str,
     """
     # Special handling for ungrouped chapters (volume "0")
     if volume_number == "0" or volume_number == 0:
-        vol_dir = "ungrouped_chapters"
-        volume_path = Path(manga_path) / vol_dir
-        return ensure_directory(volume_path)
+        return ensure_directory(Path(manga_path, "ungrouped_chapters"))
     
     # Convert volume number to a clean format (handling floats, etc.)
     vol_num = format_volume_number(volume_number)
     
-    # Try to convert to float for padding, fall back to string if not possible
-    try:
-        vol_num_float = float(vol_num)
-        # Check if it's an integer value
-        if vol_num_float.is_integer():
-            # Format with 3-digit padding for whole numbers
-            vol_num_fmt = f"{int(vol_num_float):03d}"
-        else:
-            # For decimal volumes, keep the decimal part but pad the integer part
-            int_part = int(vol_num_float)
-            decimal_part = vol_num_float - int_part
-            vol_num_fmt = f"{int_part:03d}{vol_num[vol_num.find('.'):]}"
-    except ValueError:
-        # If not numeric, just use as is
-        vol_num_fmt = vol_num
+    # Pad the integer part to 3 digits, keeping any decimal part
+    vol_num_fmt = _pad_number(vol_num, 3)
     
-    vol_dir = f"volume_{vol_num_fmt}"
-    volume_path = Path(manga_path) / vol_dir
-    return ensure_directory(volume_path)
+    # Two-argument Path() avoids building an intermediate Path for manga_path
+    return ensure_directory(Path(manga_path, "volume_" + vol_num_fmt))
 
 
 def generate_chapter_path(volume_path: Union[str, Path], 
@@ -163,21 +261,8 @@ def generate_chapter_path(volume_path: Union[str, Path],
     # Clean the chapter number format
     chap_num = format_volume_number(chapter_number)  # Reuse volume formatter for chapters
     
-    # Try to convert to float for padding, fall back to string if not possible
-    try:
-        chap_num_float = float(chap_num)
-        # Check if it's an integer value
-        if chap_num_float.is_integer():
-            # Format with 4-digit padding for whole numbers
-            chap_num_fmt = f"{int(chap_num_float):04d}"
-        else:
-            # For decimal chapters, keep the decimal part but pad the integer part
-            int_part = int(chap_num_float)
-            decimal_part = chap_num_float - int_part
-            chap_num_fmt = f"{int_part:04d}{chap_num[chap_num.find('.'):]}"
-    except ValueError:
-        # If not numeric, just use as is
-        chap_num_fmt = chap_num
+    # Pad the integer part to 4 digits, keeping any decimal part
+    chap_num_fmt = _pad_number(chap_num, 4)
     
     # Create directory name with optional title
     if chapter_title:
@@ -186,8 +271,7 @@ def generate_chapter_path(volume_path: Union[str, Path],
     else:
         chapter_dir = f"chapter_{chap_num_fmt}"
     
-    chapter_path = Path(volume_path) / chapter_dir
-    return ensure_directory(chapter_path)
+    return ensure_directory(Path(volume_path, chapter_dir))
 
 
 def generate_page_path(chapter_path: Union[str, Path], 
@@ -209,13 +293,18 @@ def generate_page_path(chapter_path: Union[str, Path],
     clean_ext = extension.lstrip('.')
     
     # Handle page number as integer with 3-digit zero-padding
-    page_num = int(page_number) if isinstance(page_number, (int, float)) or \
-               (isinstance(page_number, str) and page_number.isdigit()) else 0
+    if type(page_number) is int:
+        page_num = page_number
+    else:
+        page_num = int(page_number) if isinstance(page_number, (int, float)) or \
+                   (isinstance(page_number, str) and page_number.isdigit()) else 0
     
     # Format with 3-digit padding
     page_filename = f"{page_num:03d}.{clean_ext}"
     
-    return Path(chapter_path) / page_filename
+    # A single two-argument Path() call builds the result without an
+    # intermediate Path for chapter_path
+    return Path(chapter_path, page_filename)
 
 
 def format_manga_title(title: str) -> str:
@@ -231,8 +320,7 @@ def format_manga_title(title: str) -> str:
         return "Unknown"
     
     # Remove excess whitespace and line breaks
-    formatted = re.sub(r'\s+', ' ', title.strip())
-    return formatted
+    return " ".join(title.split()) or "Unknown"
 
 
 def format_volume_number(volume_num: Union[str, int, float, None]) -> str:
@@ -247,6 +335,15 @@ def format_volume_number(volume_num: Union[str, int, float, None]) -> str:
     if volume_num is None:
         return "Unknown"
     
+    # Fast paths for plain integers, the common case (bool is excluded on purpose)
+    if type(volume_num) is int:
+        return str(volume_num)
+    if type(volume_num) is float and volume_num.is_integer():
+        return str(int(volume_num))
+    if (isinstance(volume_num, str) and volume_num.isascii() and volume_num.isdigit()
+            and (volume_num[0] != '0' or len(volume_num) == 1)):
+        return volume_num
+    
     try:
         # Convert to float first to handle both int and decimal strings
         num = float(volume_num)
@@ -273,33 +370,63 @@ def create_table(headers: List[str], rows: List[List[str]], width: int = 80) ->
     if not rows:
         return "No data to display."
     
-    # Calculate column widths
     num_cols = len(headers)
-    col_widths = [len(h) for h in headers]
     
-    for row in rows:
-        for i, cell in enumerate(row[:num_cols]):
-            col_widths[i] = max(col_widths[i], min(len(str(cell)), width // num_cols))
+    # Stringify every cell exactly once, padding short rows and dropping extra cells
+    str_rows = [
+        [str(c) for c in row[:num_cols]] + [""] * (num_cols - len(row))
+        for row in rows
+    ]
+    
+    # Calculate column widths (cell contribution is capped, headers are not)
+    max_cell_width = width // num_cols if num_cols else 0
+    col_widths = [
+        max(len(h), min(max(map(len, column)), max_cell_width))
+        for h, column in zip(headers, zip(*str_rows))
+    ]
+    
+    # Create the table: header, separator, then one line per data row
+    result = [None] * (len(str_rows) + 2)
+    result[0] = " | ".join(map(str.ljust, headers, col_widths))
+    result[1] = "-+-".join("-" * w for w in col_widths)
+    for i, row in enumerate(str_rows, 2):
+        result[i] = " | ".join(map(str.ljust, row, col_widths))
     
-    # Create the table
-    result = []
+    return "\n".join(result)
+
+
+@functools.lru_cache(maxsize=32)
+def make_truncator(max_length: int = 80, suffix: str = "...") -> Callable[[str], str]:
+    """Create a truncation function specialized for a fixed length and suffix.
     
-    # Add header
-    header_row = " | ".join(h.ljust(w) for h, w in zip(headers, col_widths))
-    result.append(header_row)
+    Useful when many strings are truncated with the same settings, e.g. when
+    building table rows.
     
-    # Add separator
-    separator = "-+-".join("-" * w for w in col_widths)
-    result.append(separator)
+    Args:
+        max_length: Maximum length of the string.
+        suffix: String to append to indicate truncation.
+        
+    Returns:
+        A function taking the text to truncate and returning the result.
+    """
+    if not suffix:
+        def truncate(text: str) -> str:
+            if not text:
+                return ""
+            return text[:max_length]
+        
+        return truncate
     
-    # Add data rows
-    for row in rows:
-        # Ensure row has enough columns
-        padded_row = row + [""] * (num_cols - len(row))
-        data_row = " | ".join(str(c).ljust(w) for c, w in zip(padded_row[:num_cols], col_widths))
-        result.append(data_row)
+    cutoff = max_length - len(suffix)
     
-    return "\n".join(result)
+    def truncate(text: str) -> str:
+        if not text:
+            return ""
+        if len(text) <= max_length:
+            return text
+        return text[:cutoff] + suffix
+    
+    return truncate
 
 
 def truncate_string(text: str, max_length: int = 80, suffix: str = "...") -> str:
@@ -334,14 +461,17 @@ def clean_html(html_text: str) -> str:
     if not html_text:
         return ""
     
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', html_text)
-    # Decode HTML entities
-    text = html.unescape(text)
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Plain text without tags or entities only needs whitespace normalization
+    if '<' not in html_text and '&' not in html_text:
+        return " ".join(html_text.split())
     
-    return text
+    # Remove HTML tags and normalize whitespace in a single pass
+    text = _TAG_OR_WHITESPACE.sub(' ', html_text)
+    # Decode HTML entities; entities such as &nbsp; can introduce new whitespace
+    if '&' in text:
+        return " ".join(html.unescape(text).split())
+    
+    return text.strip()
 
 
 def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0, 
@@ -358,24 +488,25 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0,
         Decorator function.
     """
     def decorator(func: Callable) -> Callable:
+        # Delays before each retry are fixed per decoration, so compute them once
+        delays = tuple(delay * backoff ** i for i in range(max_attempts - 1))
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            attempt = 1
-            current_delay = delay
-            
-            while attempt <= max_attempts:
+            for attempt, current_delay in enumerate(delays, 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    if attempt == max_attempts:
-                        logger.error(f"Failed after {max_attempts} attempts: {e}")
-                        raise
-                    
-                    logger.warning(f"Attempt {attempt} failed: {e}. "
-                                   f"Retrying in {current_delay:.2f}s...")
+                    logger.warning("Attempt %d failed: %s. Retrying in %.2fs...",
+                                   attempt, e, current_delay)
                     time.sleep(current_delay)
-                    current_delay *= backoff
-                    attempt += 1
+            
+            # Final attempt: no delay afterwards, the exception propagates
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                logger.error("Failed after %d attempts: %s", max_attempts, e)
+                raise
         
         return wrapper
     
@@ -402,6 +533,32 @@ def exception_handler(func: Callable) -> Callable:
     return wrapper
 
 
+# Sentinel for manifest lookups where None is a legitimate stored value
+_MISSING = object()
+
+# Last formatted timestamp and the whole second it was taken in
+_timestamp_cache = (-1, "")
+
+
+def _now_iso() -> str:
+    """Return the current local time as an ISO 8601 string.
+    
+    Manifest timestamps are updated for every page, so the formatted string
+    is reused for all calls within the same wall-clock second.
+    """
+    global _timestamp_cache
+    
+    now = time.time()
+    second = int(now)
+    cached_second, cached_iso = _timestamp_cache
+    if second == cached_second:
+        return cached_iso
+    
+    iso = datetime.fromtimestamp(now).isoformat()
+    _timestamp_cache = (second, iso)
+    return iso
+
+
 def create_volume_manifest(manga_id: str, manga_title: str, volume_number: Union[str, int, float]) -> Dict[str, Any]:
     """Create an initial manifest structure for a manga volume.
     
@@ -413,7 +570,7 @@ def create_volume_manifest(manga_id: str, manga_title: str, volume_number: Union
     Returns:
         Dict containing the initial manifest structure.
     """
-    current_time = datetime.now().isoformat()
+    current_time = _now_iso()
     
     return {
         "manga_id": manga_id,
@@ -437,16 +594,30 @@ def save_manifest(manifest: Dict[str, Any], volume_path: Union[str, Path]) -> bo
         bool: True if successful, False otherwise.
     """
     path = Path(volume_path) / "manifest.json"
+    tmp_path = path.with_name(f"manifest.json.{uuid.uuid4().hex}.tmp")
     try:
         # Update the last_updated timestamp
-        manifest["last_updated"] = datetime.now().isoformat()
+        manifest["last_updated"] = _now_iso()
         
-        # Write the manifest to file
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        # Serialize the manifest in one go, without the in-memory counters
+        persisted = _strip_manifest_counters(manifest)
+        if orjson is not None:
+            data = orjson.dumps(persisted, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(persisted, ensure_ascii=False, indent=2).encode('utf-8')
+        
+        # Write to a uniquely named sibling file and rename it over the
+        # manifest, so an interrupted or concurrent save never leaves a
+        # truncated manifest behind
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
         return True
     except Exception as e:
         logger.error(f"Failed to save manifest to {path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         return False
 
 
@@ -465,13 +636,60 @@ def load_manifest(volume_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
             logger.warning(f"Manifest file does not exist: {path}")
             return None
             
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        data = path.read_bytes()
+        if orjson is not None:
+            manifest = orjson.loads(data)
+        else:
+            manifest = json.loads(data)
+        
+        # Counters are never trusted from disk; rebuild them from the pages
+        # and chapters actually stored (older manifests may contain stale ones)
+        chapters = manifest.get("chapters", {})
+        for chapter in chapters.values():
+            _count_chapter_pages(chapter)
+        _count_manifest_chapters(manifest, chapters)
+        return manifest
     except Exception as e:
         logger.error(f"Failed to load manifest from {path}: {e}")
         return None
 
 
+# Running counters kept on manifest and chapter dicts while they are in
+# memory; they are derived data and are not written to manifest.json
+_MANIFEST_COUNTERS = frozenset({"_chapter_count", "_complete_chapters"})
+_CHAPTER_COUNTERS = frozenset({"_page_count", "_valid_count"})
+
+
+def _strip_manifest_counters(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shallow copy of a manifest without the running counters."""
+    persisted = {k: v for k, v in manifest.items() if k not in _MANIFEST_COUNTERS}
+    chapters = manifest.get("chapters")
+    if isinstance(chapters, dict):
+        persisted["chapters"] = {
+            chapter_id: {k: v for k, v in chapter.items() if k not in _CHAPTER_COUNTERS}
+            if isinstance(chapter, dict) else chapter
+            for chapter_id, chapter in chapters.items()
+        }
+    return persisted
+
+
+def _count_chapter_pages(chapter: Dict[str, Any]) -> None:
+    """Recompute a chapter's running page counters from its pages."""
+    pages = chapter.get("pages", {})
+    chapter["_page_count"] = len(pages)
+    chapter["_valid_count"] = sum(
+        1 for page in pages.values() if page.get("status") == "valid"
+    )
+
+
+def _count_manifest_chapters(manifest: Dict[str, Any], chapters: Dict[str, Any]) -> None:
+    """Recompute a manifest's running chapter counters from its chapters."""
+    manifest["_chapter_count"] = len(chapters)
+    manifest["_complete_chapters"] = sum(
+        1 for chapter in chapters.values() if chapter.get("status") == "complete"
+    )
+
+
 def update_manifest_chapter(manifest: Dict[str, Any], chapter_data: Dict[str, Any]) -> Dict[str, Any]:
     """Add or update a chapter in the manifest.
     
@@ -487,33 +705,42 @@ def update_manifest_chapter(manifest: Dict[str, Any], chapter_data: Dict[str, An
         logger.warning("Chapter data missing ID, cannot update manifest")
         return manifest
     
+    now = _now_iso()
+    
     # Get existing chapter data if it exists
     chapters = manifest.get("chapters", {})
-    current_chapter = chapters.get(chapter_id, {})
-    
-    # Merge the new data with existing data, with new data taking precedence
-    updated_chapter = {
-        **current_chapter,
-        **chapter_data,
-        "last_updated": datetime.now().isoformat()
-    }
+    if "_chapter_count" not in manifest:
+        # Manifests written before the counters existed
+        _count_manifest_chapters(manifest, chapters)
+    current_chapter = chapters.get(chapter_id)
+    if current_chapter is None:
+        current_chapter = {}
+        manifest["_chapter_count"] += 1
+    was_complete = current_chapter.get("status") == "complete"
+    
+    # Merge the new data into the existing entry in place, with new data
+    # taking precedence (the entry is owned by the manifest, so no copy is needed)
+    updated_chapter = current_chapter
+    updated_chapter.update(chapter_data)
+    updated_chapter["last_updated"] = now
     
     # Ensure status is set
     if "status" not in updated_chapter:
         updated_chapter["status"] = "incomplete"
     
+    # Page counters are stale if the pages were replaced or never counted
+    if "pages" in chapter_data or "_page_count" not in updated_chapter:
+        _count_chapter_pages(updated_chapter)
+    
     # Update the manifest
     chapters[chapter_id] = updated_chapter
     manifest["chapters"] = chapters
-    manifest["last_updated"] = datetime.now().isoformat()
+    manifest["last_updated"] = now
     
-    # Check if all chapters are complete to update volume status
-    all_complete = all(
-        chapter.get("status") == "complete"
-        for chapter in chapters.values()
-    )
+    # Update volume status from the running count of complete chapters
+    manifest["_complete_chapters"] += (updated_chapter["status"] == "complete") - was_complete
     
-    if all_complete and chapters:
+    if manifest["_complete_chapters"] == manifest["_chapter_count"] > 0:
         manifest["status"] = "complete"
     else:
         manifest["status"] = "incomplete"
@@ -536,24 +763,60 @@ def update_manifest_page(
     Returns:
         The updated manifest.
     """
+    return _update_manifest_page(manifest, chapter_id, page_data, _now_iso())
+
+
+def _update_manifest_page(
+    manifest: Dict[str, Any], 
+    chapter_id: str, 
+    page_data: Dict[str, Any],
+    now: str
+) -> Dict[str, Any]:
+    """Update a page in the manifest using a precomputed ISO timestamp.
+    
+    Lets batch callers such as validate_chapter_files compute the timestamp
+    once instead of once per page. Chapter and volume completeness are derived
+    from running counters, so each update is O(1) in the number of pages and
+    chapters.
+    """
     chapters = manifest.get("chapters", {})
-    chapter = chapters.get(chapter_id, {})
+    chapter = chapters.get(chapter_id)
+    page_number = str(page_data.get("page_number", "unknown"))
+    
+    # Get existing page data if it exists
+    current_page = chapter.get("pages", {}).get(page_number) if chapter is not None else None
+    
+    # Re-reporting a page with identical data (e.g. when re-scanning) is a
+    # no-op: leave statuses and timestamps alone so the manifest stays clean
+    if current_page is not None and "status" in current_page and all(
+        current_page.get(key, _MISSING) == value
+        for key, value in page_data.items() if key != "last_updated"
+    ):
+        return manifest
+    
+    if "_chapter_count" not in manifest:
+        # Manifests written before the counters existed
+        _count_manifest_chapters(manifest, chapters)
+    if chapter is None:
+        chapter = {}
+        manifest["_chapter_count"] += 1
+    was_complete = chapter.get("status") == "complete"
     
     # Initialize pages dict if it doesn't exist
     if "pages" not in chapter:
         chapter["pages"] = {}
+    if "_page_count" not in chapter:
+        _count_chapter_pages(chapter)
     
-    page_number = str(page_data.get("page_number", "unknown"))
+    if current_page is None:
+        current_page = {}
+        chapter["_page_count"] += 1
+    was_valid = current_page.get("status") == "valid"
     
-    # Get existing page data if it exists
-    current_page = chapter["pages"].get(page_number, {})
-    
-    # Merge the new data with existing data
-    updated_page = {
-        **current_page,
-        **page_data,
-        "last_updated": datetime.now().isoformat()
-    }
+    # Merge the new data into the existing entry in place
+    updated_page = current_page
+    updated_page.update(page_data)
+    updated_page["last_updated"] = now
     
     # Ensure status is set
     if "status" not in updated_page:
@@ -561,57 +824,107 @@ def update_manifest_page(
     
     # Update the page in the chapter
     chapter["pages"][page_number] = updated_page
+    chapter["_valid_count"] += (updated_page["status"] == "valid") - was_valid
     
     # Update chapter in manifest
     chapters[chapter_id] = chapter
     manifest["chapters"] = chapters
     
     # Update chapter status based on pages
-    all_valid = all(
-        page.get("status") == "valid"
-        for page in chapter["pages"].values()
-    )
-    
-    if all_valid and chapter["pages"]:
+    if chapter["_valid_count"] == chapter["_page_count"] > 0:
         chapter["status"] = "complete"
     else:
         chapter["status"] = "incomplete"
     
     # Update volume status based on chapters
-    all_chapters_complete = all(
-        chapter.get("status") == "complete"
-        for chapter in chapters.values()
-    )
+    manifest["_complete_chapters"] += (chapter["status"] == "complete") - was_complete
     
-    if all_chapters_complete and chapters:
+    if manifest["_complete_chapters"] == manifest["_chapter_count"] > 0:
         manifest["status"] = "complete"
     else:
         manifest["status"] = "incomplete"
     
     # Update timestamp
-    manifest["last_updated"] = datetime.now().isoformat()
+    manifest["last_updated"] = now
     
     return manifest
 
 
-def is_valid_image(file_path: Union[str, Path]) -> bool:
+# File extensions of page images, as written by the downloader
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
+# Signatures and end-of-stream markers used by the is_valid_image fast path
+_JPEG_SIGNATURE = b'\xff\xd8\xff'
+_JPEG_EOI = b'\xff\xd9'
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_PNG_IEND = b'IEND\xaeB`\x82'
+_GIF_SIGNATURES = (b'GIF87a', b'GIF89a')
+_GIF_TRAILER = b';'
+_IMAGE_TAIL_SIZE = 32
+
+
+def _has_image_markers(path: Path, size: int) -> bool:
+    """Check an image's signature and end-of-stream marker without decoding it.
+    
+    Only the first 12 and last few bytes are read. This catches wrong content
+    types and truncated downloads, which are the failures seen in practice.
+    
+    Args:
+        path: Path to the image file.
+        size: Size of the file in bytes.
+        
+    Returns:
+        bool: True if the file starts and ends like a complete JPEG, PNG,
+        GIF or WebP image, False if it does not or the format is unknown.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(12)
+        f.seek(max(size - _IMAGE_TAIL_SIZE, 0))
+        tail = f.read()
+    
+    if head.startswith(_JPEG_SIGNATURE):
+        # Some encoders pad the file with zero bytes after the EOI marker
+        return tail.rstrip(b'\x00').endswith(_JPEG_EOI)
+    if head.startswith(_PNG_SIGNATURE):
+        return tail.endswith(_PNG_IEND)
+    if head[:6] in _GIF_SIGNATURES:
+        return tail.endswith(_GIF_TRAILER)
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        # The RIFF header records the payload size (file size minus 8 bytes)
+        return int.from_bytes(head[4:8], 'little') + 8 <= size
+    return False
+
+
+def is_valid_image(file_path: Union[str, Path], strict: bool = False) -> bool:
     """Check if a file is a valid image.
     
+    By default a file whose header and trailer match a known image format is
+    accepted without decoding. Anything else, or every file when strict is
+    True, is verified with Pillow.
+    
     Args:
         file_path: Path to the image file.
+        strict: If True, always run Pillow's verification.
         
     Returns:
         bool: True if the file exists, has non-zero size, and is a valid image.
     """
     try:
-        from PIL import Image
-        
         path = Path(file_path)
         
         # Check if file exists and has size > 0
-        if not path.exists() or path.stat().st_size == 0:
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size == 0:
             return False
         
+        if not strict and _has_image_markers(path, size):
+            return True
+        
+        from PIL import Image
+        
         # Try to open as an image
         with Image.open(path) as img:
             img.verify()  # Verify it's a valid image
@@ -625,7 +938,8 @@ def is_valid_image(file_path: Union[str, Path]) -> bool:
 def validate_chapter_files(
     chapter_path: Union[str, Path], 
     manifest: Dict[str, Any],
-    chapter_id: str
+    chapter_id: str,
+    max_workers: int = 16
 ) -> Dict[str, bool]:
     """Validate all image files in a chapter.
     
@@ -633,6 +947,7 @@ def validate_chapter_files(
         chapter_path: Path to the chapter directory.
         manifest: The manifest containing expected pages.
         chapter_id: ID of the chapter to validate.
+        max_workers: Maximum number of threads used to check files.
         
     Returns:
         Dict mapping page numbers to validation status.
@@ -644,20 +959,53 @@ def validate_chapter_files(
         chapter_data = manifest.get("chapters", {}).get(chapter_id, {})
         pages_data = chapter_data.get("pages", {})
         
-        # Get all image files in the directory
+        # Get all image files in the directory with a single scan
         path = Path(chapter_path)
-        image_files = [f for f in path.glob("*.jpg") or path.glob("*.png") or path.glob("*.jpeg")]
+        try:
+            with os.scandir(path) as entries:
+                image_files = frozenset(
+                    entry.name for entry in entries
+                    if os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS
+                    and entry.is_file(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            image_files = frozenset()
+        
+        # Pages whose file belongs in this chapter directory but was not
+        # listed are invalid without opening anything
+        pages = list(pages_data.items())
+        file_paths = [page_data.get("file_path") for _, page_data in pages]
+        missing = [
+            bool(file_path)
+            and Path(file_path).parent == path
+            and Path(file_path).name not in image_files
+            for file_path in file_paths
+        ]
+        
+        # Check the other image files concurrently; the work is dominated by file I/O
+        to_check = [
+            file_path for file_path, is_missing in zip(file_paths, missing)
+            if file_path and not is_missing
+        ]
+        if len(to_check) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(to_check))) as executor:
+                checked = iter(list(executor.map(is_valid_image, to_check)))
+        else:
+            checked = iter([is_valid_image(file_path) for file_path in to_check])
+        
+        # All pages validated in this pass share one timestamp
+        now = _now_iso()
         
-        # Validate each expected page
-        for page_num, page_data in pages_data.items():
-            file_path = page_data.get("file_path")
+        # Record results and update the manifest on this thread only
+        for (page_num, page_data), file_path, is_missing in zip(pages, file_paths, missing):
             if file_path:
-                valid = is_valid_image(file_path)
+                valid = False if is_missing else next(checked)
                 results[page_num] = valid
                 
-                # Update manifest with validation result
-                page_data["status"] = "valid" if valid else "invalid"
-                manifest = update_manifest_page(manifest, chapter_id, page_data)
+                # Update manifest with validation result (pass a copy so the
+                # stored page still holds the previous status for the counters)
+                page_data = {**page_data, "status": "valid" if valid else "invalid"}
+                manifest = _update_manifest_page(manifest, chapter_id, page_data, now)
             else:
                 results[page_num] = False
         
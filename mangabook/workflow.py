@@ -7,16 +7,23 @@ including image processing and EPUB generation.
 import os
 import shutil
 import asyncio
+import contextlib
+import functools
 import logging
 import json
+import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set, Tuple, Union
 import click
 from tqdm import tqdm
 import sys
 import subprocess
+import time
 from datetime import datetime
-import traceback
+from collections import Counter
+from importlib import metadata
+from importlib.util import find_spec
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from .api import get_api
 from .downloader import ChapterDownloader, download_manga_volumes
@@ -24,7 +31,10 @@ from .epub.image import ImageProcessor
 from .epub.builder import EPUBBuilder
 from .epub.kobo import KepubBuilder
 from .epub.enhanced_builder import EnhancedEPUBBuilder, EnhancedKepubBuilder
-from .utils import sanitize_filename, ensure_directory, generate_manga_path, generate_volume_path, load_manifest
+from .utils import (
+    sanitize_filename, ensure_directory, reset_directory_cache, generate_manga_path,
+    generate_volume_path, load_manifest
+)
 from .error import error_handler, ErrorCategory, MangaBookError
 from .ui import (
     print_info, print_success, print_warning, print_error, 
@@ -35,6 +45,169 @@ from .history import manga_history
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Splits names into text and number runs for natural ordering
+_NUMBER_RUN = re.compile(r'(\d+)')
+
+# Volume number in a kepub file or volume directory name
+_VOLUME_RE = re.compile(r'volume[_\s-]*(\d+)', re.IGNORECASE)
+
+
+def _natural_key(name: str) -> List[Union[str, int]]:
+    """Sort key that orders "chapter_2" before "chapter_10"."""
+    return [int(part) if part.isdecimal() else part for part in _NUMBER_RUN.split(name)]
+
+
+@functools.lru_cache(maxsize=256)
+def _format_volume_number(volume_number: str) -> str:
+    """Format a volume number with 3-digit zero-padding for filenames.
+    
+    "1" becomes "001" and "1.5" becomes "001.5"; anything that isn't a
+    number is returned unchanged.
+    """
+    try:
+        value = float(volume_number)
+        text = str(value)
+        if value.is_integer():
+            return f"{int(value):03d}"
+        return f"{int(value):03d}{text[text.find('.'):]}"
+    except ValueError:
+        return str(volume_number)
+
+
+def _files_size(directories: List[Path]) -> int:
+    """Total size in bytes of the files directly inside the given directories."""
+    total = 0
+    for directory in directories:
+        with os.scandir(directory) as entries:
+            total += sum(entry.stat().st_size for entry in entries if entry.is_file())
+    return total
+
+
+def _process_chapter_images(processed_dir: Path, quality: int,
+                            chapter_dir: Path) -> Dict[str, List[Path]]:
+    """Process all images of one chapter.
+    
+    Runs in a worker process, so it builds its own ImageProcessor.
+    
+    Args:
+        processed_dir: Directory for processed images of the volume.
+        quality: Image quality (1-100).
+        chapter_dir: Directory containing the chapter's downloaded images.
+        
+    Returns:
+        Dict[str, List[Path]]: Mapping of source files to processed files.
+    """
+    img_processor = ImageProcessor(
+        output_dir=processed_dir,
+        quality=quality,
+        split_wide_pages=True
+    )
+    return img_processor.process_directory(
+        source_dir=chapter_dir,
+        output_subdir=chapter_dir.name
+    )
+
+
+def _build_volume_epubs(volume_number: str, all_images: List[Path],
+                        options: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """Build the EPUB (and KEPUB) files for one volume.
+    
+    Runs in a worker process, so everything it needs comes in through
+    picklable arguments.
+    
+    Args:
+        volume_number: Volume number.
+        all_images: Processed images in reading order.
+        options: Build settings from process_manga.
+        
+    Returns:
+        Tuple[List[str], List[str]]: Built files, and the copies placed in
+        the Kobo collection.
+    """
+    manga_id = options["manga_id"]
+    manga_title = options["manga_title"]
+    language = options["language"]
+    force_overwrite = options["force_overwrite"]
+    manga_collection_dir = options["manga_collection_dir"]
+    safe_manga_title = options["safe_manga_title"]
+    readable_manga_title = options["readable_manga_title"]
+    
+    created_files = []
+    collection_files = []
+    
+    vol_num_fmt = _format_volume_number(volume_number)
+
+    # Create standard EPUB
+    epub_filename = f"{safe_manga_title}_vol_{vol_num_fmt}.epub"
+    
+    # Use manga_collection_dir for the epub_path
+    epub_path = manga_collection_dir / epub_filename
+    
+    epub_builder = EnhancedEPUBBuilder(
+        title=f"{manga_title} - Volume {volume_number}",
+        author=f"MangaDex ID: {manga_id}",
+        language=language,
+        identifier=f"mangadex:{manga_id}:vol:{volume_number}",
+        output_dir=manga_collection_dir  # Pass the manga collection directory as output_dir
+    )
+    
+    # Add all images to EPUB
+    for img_path in all_images:
+        epub_builder.add_image(img_path)
+    
+    # Write EPUB file
+    epub_output = epub_builder.write(str(epub_path), force_overwrite=force_overwrite)
+    created_files.append(epub_output)
+    
+    # The builder holds every page's bytes; release them before the KEPUB
+    # builder loads its own copy so peak memory stays at one volume
+    del epub_builder
+    
+    # Create Kobo-compatible KEPUB if requested
+    if options["kobo"]:
+        kepub_filename = f"{safe_manga_title}_vol_{vol_num_fmt}.kepub.epub"
+        # Use manga_collection_dir for kepub_path for consistency with output_dir
+        kepub_path = manga_collection_dir / kepub_filename
+        
+        kepub_builder = EnhancedKepubBuilder(
+            title=f"{manga_title} - Volume {volume_number}",
+            author=f"MangaDex ID: {manga_id}",
+            language=language,
+            identifier=f"mangadex:{manga_id}:vol:{volume_number}",
+            output_dir=manga_collection_dir  # Pass the manga collection directory as output_dir
+        )
+        
+        # Add all images to KEPUB
+        for img_path in all_images:
+            kepub_builder.add_image(img_path)
+        
+        # Write KEPUB file
+        kepub_output = kepub_builder.write(str(kepub_path), force_overwrite=force_overwrite)
+        created_files.append(kepub_output)
+        
+        # If collection folder specified, create a more readable structure
+        if options["create_kobo_collection"]:
+            kobo_dir = options["kobo_dir"]
+            
+            # Create parent directories
+            ensure_directory(kobo_dir)
+            
+            # Create a readable filename for the collection
+            collection_filename = f"{readable_manga_title} - Volume {vol_num_fmt}.kepub.epub"
+            collection_path = kobo_dir / collection_filename
+            
+            # Only need to copy the file if the paths are different
+            if str(kepub_path) != str(collection_path):
+                # Hardlink when possible so the collection doesn't hold a
+                # second copy of every volume
+                _collect_kobo_file(str(kepub_path), str(collection_path),
+                                   create_symlinks=False, create_hardlinks=True)
+                logger.info(f"Added KEPUB to collection: {collection_path}")
+                # Add this file to the results too
+                collection_files.append(str(collection_path))
+    
+    return created_files, collection_files
+
 
 async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
                       output_dir: str, keep_raw: bool = False, quality: int = 85,
@@ -67,8 +240,10 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
     Returns:
         Dict with processing results.
     """
-    # Track start time
+    # Track start time; the monotonic clock measures elapsed time so it
+    # isn't thrown off by clock adjustments during a long run
     start_time = datetime.now()
+    start_clock = time.monotonic()
     
     results = {
         "manga_id": manga_id,
@@ -84,10 +259,18 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
         "started_at": str(start_time),
     }
     
+    def record_completion() -> None:
+        results["completed_at"] = str(datetime.now())
+        results["elapsed_seconds"] = time.monotonic() - start_clock
+    
     # Get the API instance for later use
     api = await get_api()
     
     try:
+        # Directories cached by an earlier run in this process may have
+        # been removed since
+        reset_directory_cache()
+        
         # Step 1: Create output directory
         output_dir = Path(output_dir)
         ensure_directory(output_dir)
@@ -128,6 +311,10 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
         # Step 3: Process each volume
         total_volumes = len(volumes)
         
+        # Worker processes for image processing, shared by all volumes
+        # (workers start with an empty directory cache rather than a forked copy)
+        image_pool = ProcessPoolExecutor(initializer=reset_directory_cache)
+        
         # Use enhanced progress bar with ETA
         progress = EnhancedProgress(
             total=total_volumes,
@@ -136,203 +323,237 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
             show_eta=True
         )
         
-        for volume_number in volumes:
-            print_info(f"\nProcessing volume {ColorfulFormatter.volume(volume_number)}...")
-            
-            # Step 3.1: Download volume
-            download_result = await error_handler.safe_execute_async(
-                downloader.download_volume,
-                manga_id=manga_id,
-                manga_title=manga_title,
-                volume_number=volume_number,
-                language=language,
-                check_local=check_local,
-                force_download=force_download,
-                error_category=ErrorCategory.NETWORK,
-                display=True
-            )
-            
-            if not download_result:
-                print_error(f"Failed to download volume {volume_number}")
-                results["failed"] += 1
-                results["volumes"][volume_number] = {"success": False, "message": "Download failed"}
-                progress.update(1)
-                continue
-            
-            results["volumes"][volume_number] = download_result
-            
-            if not download_result["success"]:
-                print_error(f"Failed to download volume {volume_number}: {download_result['message']}")
-                results["failed"] += 1
-                progress.update(1)
-                continue
-            
-            # Step 3.2: Process images
-            try:
-                volume_path = Path(download_result["volume_path"])
-                processed_dir = volume_path / "processed"
+        loop = asyncio.get_running_loop()
+        
+        # Volumes flow through a download -> process -> build pipeline so the
+        # next volume downloads while the previous one is being converted.
+        # Small queues keep downloads from running too far ahead.
+        download_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        build_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        pending_validations: List[str] = []
+        kobo_collection_files: List[str] = []
+        
+        def fail_volume(volume_number: str, message: str) -> None:
+            results["volumes"][volume_number]["error"] = message
+            results["failed"] += 1
+            progress.update(1)
+        
+        # Run-wide names and paths, worked out once for every volume
+        safe_manga_title = sanitize_filename(manga_title)
+        # Use specified collection_root or default to {output_dir}/manga-collection
+        root_dir = Path(collection_root) if collection_root else manga_collection_dir
+        kobo_dir = root_dir / safe_manga_title
+        
+        # Everything a pool worker needs to build a volume; must stay picklable
+        build_options = {
+            "manga_id": manga_id,
+            "manga_title": manga_title,
+            "safe_manga_title": safe_manga_title,
+            "readable_manga_title": manga_title.replace('_', ' '),
+            "language": language,
+            "kobo": kobo,
+            "force_overwrite": force_overwrite,
+            "create_kobo_collection": create_kobo_collection,
+            "kobo_dir": kobo_dir,
+            "manga_collection_dir": manga_collection_dir,
+        }
+        
+        async def download_stage() -> None:
+            for volume_number in volumes:
+                print_info(f"\nProcessing volume {ColorfulFormatter.volume(volume_number)}...")
                 
-                # Initialize image processor
-                img_processor = ImageProcessor(
-                    output_dir=processed_dir,
-                    quality=quality,
-                    split_wide_pages=True
+                # Step 3.1: Download volume
+                download_result = await error_handler.safe_execute_async(
+                    downloader.download_volume,
+                    manga_id=manga_id,
+                    manga_title=manga_title,
+                    volume_number=volume_number,
+                    language=language,
+                    check_local=check_local,
+                    force_download=force_download,
+                    error_category=ErrorCategory.NETWORK,
+                    display=True
                 )
                 
-                # Find chapter directories
-                chapter_dirs = [d for d in volume_path.iterdir() if d.is_dir() and d.name.startswith("chapter_")]
-                # Group processed images by chapter
-                chapter_image_map = {}
+                if not download_result:
+                    print_error(f"Failed to download volume {volume_number}")
+                    results["failed"] += 1
+                    results["volumes"][volume_number] = {"success": False, "message": "Download failed"}
+                    progress.update(1)
+                    continue
                 
-                # Track if any chapter failed image processing
-                chapter_processing_failed = False
-                for chapter_dir in chapter_dirs:
-                    # Process all images in the chapter
-                    processed = error_handler.safe_execute(
-                        img_processor.process_directory,
-                        source_dir=chapter_dir,
-                        output_subdir=chapter_dir.name,
-                        error_category=ErrorCategory.CONVERSION,
-                        display=True
-                    )
-                    if not processed:
-                        results["warnings"].append(f"Failed to process images in {chapter_dir.name} (volume {volume_number})")
-                        chapter_processing_failed = True
-                        continue
-                    # Collect all processed images for this chapter
-                    chapter_image_map[chapter_dir.name] = []
-                    for source_file, proc_files in processed.items():
-                        chapter_image_map[chapter_dir.name].extend(proc_files)
-                # Sort chapters by name (which should be in reading order)
-                sorted_chapters = sorted(chapter_image_map.items())
-
-                # If any chapter failed, mark the volume as failed and skip EPUB generation
-                if chapter_processing_failed:
-                    print_error(f"Failed to process images for one or more chapters in volume {volume_number}. Skipping EPUB generation.")
+                results["volumes"][volume_number] = download_result
+                
+                if not download_result["success"]:
+                    print_error(f"Failed to download volume {volume_number}: {download_result['message']}")
                     results["failed"] += 1
-                    results["volumes"][volume_number]["error"] = "Image processing failed for one or more chapters."
                     progress.update(1)
                     continue
                 
-                # Step 3.3: Generate EPUB and KEPUB files
+                await download_queue.put((volume_number, Path(download_result["volume_path"])))
+            
+            # Only on normal completion: if a stage fails, the others are
+            # cancelled, and waiting here on a full queue would never return
+            await download_queue.put(None)
+        
+        async def process_stage() -> None:
+            while True:
+                item = await download_queue.get()
+                if item is None:
+                    break
+                volume_number, volume_path = item
+                
+                # Step 3.2: Process images
                 try:
-                    print_info(f"Generating EPUB/KEPUB files for volume {volume_number}...")
+                    processed_dir = volume_path / "processed"
                     
-                    # Get chapter info from manifest for metadata
-                    volume_manifest = load_manifest(volume_path)
-                    chapter_data = volume_manifest.get("chapters", {})
-                    
-                    # Prepare images in reading order
-                    all_images = []
-                    for chapter_name, images in sorted_chapters:
-                        all_images.extend(sorted(images))
+                    # Find chapter directories, in natural name order (which should be reading order)
+                    with os.scandir(volume_path) as entries:
+                        chapter_dirs = [
+                            Path(entry.path) for entry in entries
+                            if entry.name.startswith("chapter_") and entry.is_dir(follow_symlinks=False)
+                        ]
+                    chapter_dirs.sort(key=lambda d: _natural_key(d.name))
                     
-                    if not all_images:
-                        print_error(f"No valid images found for volume {volume_number}")
-                        results["failed"] += 1
-                        results["volumes"][volume_number]["error"] = "No valid images found"
-                        progress.update(1)
+                    # Processed pages, the EPUB and the KEPUB each take about as
+                    # much room as the raw pages; stop before doing the work if
+                    # the volume can't be written
+                    raw_mb = _files_size(chapter_dirs) / (1024 * 1024)
+                    space = check_disk_space(manga_collection_dir,
+                                             required_mb=raw_mb * (3 if kobo else 2))
+                    if not space["enough_space"] and "error" not in space:
+                        print_error(f"Not enough disk space to build volume {volume_number}")
+                        fail_volume(volume_number, "Not enough disk space")
                         continue
                     
-                    # Format volume number with 3-digit zero-padding for filenames
-                    try:
-                        vol_num_float = float(volume_number)
-                        if vol_num_float.is_integer():
-                            vol_num_fmt = f"{int(vol_num_float):03d}"
-                        else:
-                            int_part = int(vol_num_float)
-                            vol_num_fmt = f"{int_part:03d}{str(vol_num_float)[str(vol_num_float).find('.'):]}"
-                    except ValueError:
-                        vol_num_fmt = str(volume_number)
-
-                    # Create standard EPUB
-                    epub_filename = f"{sanitize_filename(manga_title)}_vol_{vol_num_fmt}.epub"
-                    
-                    # Use manga_collection_dir for the epub_path
-                    epub_path = manga_collection_dir / epub_filename
-                    
-                    epub_builder = EnhancedEPUBBuilder(
-                        title=f"{manga_title} - Volume {volume_number}",
-                        author=f"MangaDex ID: {manga_id}",
-                        language=language,
-                        identifier=f"mangadex:{manga_id}:vol:{volume_number}",
-                        output_dir=manga_collection_dir  # Pass the manga collection directory as output_dir
+                    # Process all chapters in parallel; image work is CPU-bound
+                    chapter_results = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(
+                                image_pool, _process_chapter_images,
+                                processed_dir, quality, chapter_dir
+                            )
+                            for chapter_dir in chapter_dirs
+                        ),
+                        return_exceptions=True
                     )
                     
-                    # Add all images to EPUB
-                    for img_path in all_images:
-                        epub_builder.add_image(img_path)
-                    
-                    # Write EPUB file
-                    epub_output = epub_builder.write(str(epub_path), force_overwrite=force_overwrite)
-                    results["epub_files"].append(epub_output)
-                    
-                    # Create Kobo-compatible KEPUB if requested
-                    if kobo:
-                        kepub_filename = f"{sanitize_filename(manga_title)}_vol_{vol_num_fmt}.kepub.epub"
-                        # Use manga_collection_dir for kepub_path for consistency with output_dir
-                        kepub_path = manga_collection_dir / kepub_filename
-                        
-                        kepub_builder = EnhancedKepubBuilder(
-                            title=f"{manga_title} - Volume {volume_number}",
-                            author=f"MangaDex ID: {manga_id}",
-                            language=language,
-                            identifier=f"mangadex:{manga_id}:vol:{volume_number}",
-                            output_dir=manga_collection_dir  # Pass the manga collection directory as output_dir
-                        )
-                        
-                        # Add all images to KEPUB
-                        for img_path in all_images:
-                            kepub_builder.add_image(img_path)
-                        
-                        # Write KEPUB file
-                        kepub_output = kepub_builder.write(str(kepub_path), force_overwrite=force_overwrite)
-                        results["epub_files"].append(kepub_output)
-                        
-                        # If collection folder specified, create a more readable structure
-                        if create_kobo_collection:
-                            # Use specified collection_root or default to {output_dir}/manga-collection
-                            root_dir = Path(collection_root) if collection_root else Path(output_dir) / "manga-collection"
-                            kobo_dir = root_dir / sanitize_filename(manga_title)
-                            
-                            # Create parent directories
-                            ensure_directory(kobo_dir)
-                            
-                            # Create a readable filename for the collection
-                            readable_name = manga_title.replace('_', ' ')
-                            collection_filename = f"{readable_name} - Volume {vol_num_fmt}.kepub.epub"
-                            collection_path = kobo_dir / collection_filename
-                            
-                            # Only need to copy the file if the paths are different
-                            if str(kepub_path) != str(collection_path):
-                                shutil.copy2(kepub_path, collection_path)
-                                logger.info(f"Copied KEPUB to collection: {collection_path}")
-                                # Add this file to the results too
-                                results["epub_files"].append(str(collection_path))
-                    
-                    print_success(f"Generated EPUB files for volume {volume_number}")
+                    # Collect images in reading order, tracking if any chapter failed
+                    all_images = []
+                    chapter_processing_failed = False
+                    for chapter_dir, processed in zip(chapter_dirs, chapter_results):
+                        if isinstance(processed, Exception):
+                            error = error_handler.handle(processed, category=ErrorCategory.CONVERSION)
+                            error_handler.display_error(error)
+                            processed = None
+                        if not processed:
+                            results["warnings"].append(f"Failed to process images in {chapter_dir.name} (volume {volume_number})")
+                            chapter_processing_failed = True
+                            continue
+                        all_images.extend(sorted(
+                            (
+                                proc_file
+                                for proc_files in processed.values()
+                                for proc_file in proc_files
+                            ),
+                            key=lambda p: _natural_key(p.name)
+                        ))
+
+                    # If any chapter failed, mark the volume as failed and skip EPUB generation
+                    if chapter_processing_failed:
+                        print_error(f"Failed to process images for one or more chapters in volume {volume_number}. Skipping EPUB generation.")
+                        fail_volume(volume_number, "Image processing failed for one or more chapters.")
+                        continue
                     
-                except Exception as epub_error:
-                    error = error_handler.handle(epub_error, category=ErrorCategory.CONVERSION)
+                    if not all_images:
+                        print_error(f"No valid images found for volume {volume_number}")
+                        fail_volume(volume_number, "No valid images found")
+                        continue
+                
+                except Exception as volume_error:
+                    error = error_handler.handle(volume_error, category=ErrorCategory.UNEXPECTED)
                     error_handler.display_error(error)
-                    logger.error(f"Error generating EPUB for volume {volume_number}: {epub_error}")
-                    results["volumes"][volume_number]["error"] = f"EPUB generation failed: {str(epub_error)}"
-                    results["failed"] += 1
-                    progress.update(1)
+                    logger.error(f"Error processing volume {volume_number}: {volume_error}")
+                    fail_volume(volume_number, str(volume_error))
                     continue
+                
+                await build_queue.put((volume_number, all_images))
             
-            except Exception as volume_error:
-                error = error_handler.handle(volume_error, category=ErrorCategory.UNEXPECTED)
+            # End of volumes; like download_stage, only on normal completion
+            await build_queue.put(None)
+        
+        async def build_volume(volume_number: str, all_images: List[Path]) -> None:
+            # Step 3.3: Generate EPUB and KEPUB files
+            try:
+                print_info(f"Generating EPUB/KEPUB files for volume {volume_number}...")
+                
+                # Building is CPU-bound, so it runs in the pool alongside the
+                # next volume's image processing
+                created_files, collection_files = await loop.run_in_executor(
+                    image_pool, _build_volume_epubs,
+                    volume_number, all_images, build_options
+                )
+                results["epub_files"].extend(created_files + collection_files)
+                kobo_collection_files.extend(collection_files)
+                
+                # Validated together once all volumes are built;
+                # collection copies are identical and not rechecked
+                if validate:
+                    pending_validations.extend(created_files)
+                
+                print_success(f"Generated EPUB files for volume {volume_number}")
+                
+            except Exception as epub_error:
+                error = error_handler.handle(epub_error, category=ErrorCategory.CONVERSION)
                 error_handler.display_error(error)
-                logger.error(f"Error processing volume {volume_number}: {volume_error}")
-                results["volumes"][volume_number]["error"] = str(volume_error)
-                results["failed"] += 1
-                progress.update(1)
-                continue
+                logger.error(f"Error generating EPUB for volume {volume_number}: {epub_error}")
+                fail_volume(volume_number, f"EPUB generation failed: {str(epub_error)}")
+                return
             
             results["successful"] += 1
             progress.update(1)
         
+        async def build_stage() -> None:
+            # One build at a time: each holds a whole volume's pages in a
+            # worker, so overlapping builds would undo the bounded queues
+            while True:
+                item = await build_queue.get()
+                if item is None:
+                    break
+                await build_volume(*item)
+        
+        stages = [
+            asyncio.ensure_future(download_stage()),
+            asyncio.ensure_future(process_stage()),
+            asyncio.ensure_future(build_stage()),
+        ]
+        try:
+            await asyncio.gather(*stages)
+        finally:
+            # If a stage failed, stop the others (a producer could otherwise
+            # block forever on a full queue) and let them unwind before the
+            # pool and downloader are shut down underneath them
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+        
+        # Step 3.4: Validate generated files concurrently
+        if pending_validations:
+            print_info(f"Validating {len(pending_validations)} EPUB files...")
+            
+            # Each epubcheck run is a JVM; cap how many start at once
+            validation_slots = asyncio.Semaphore(min(4, os.cpu_count() or 1))
+            
+            async def validate_limited(epub_file: str) -> Dict[str, Any]:
+                async with validation_slots:
+                    return await validate_epub(epub_file)
+            
+            validation_results = await asyncio.gather(
+                *(validate_limited(epub_file) for epub_file in pending_validations)
+            )
+            results["validation_results"] = dict(zip(pending_validations, validation_results))
+        
+        
         # Step 4: Record in history
         if results["successful"] > 0:
             manga_history.record_manga_download(
@@ -360,11 +581,10 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
         print_info(f"Total files created: {len(results['epub_files'])}")
         
         # Print download statistics if available
-        download_stats = {}
-        for vol_num, vol_result in results.get("volumes", {}).items():
+        download_stats = Counter()
+        for vol_result in results.get("volumes", {}).values():
             if isinstance(vol_result, dict) and "stats" in vol_result:
-                for key, value in vol_result["stats"].items():
-                    download_stats[key] = download_stats.get(key, 0) + value
+                download_stats.update(vol_result["stats"])
         
         if download_stats:
             print_header("Download Statistics", width=60)
@@ -374,21 +594,14 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
             print_info(f"Download retries: {download_stats.get('retries', 0)}")
         
         # Step 5: Summary
-        # Calculate end time
-        end_time = datetime.now()
-        elapsed_time = end_time - start_time
-        results["completed_at"] = str(end_time)
-        results["elapsed_seconds"] = elapsed_time.total_seconds()
+        record_completion()
         
         # Since Kobo files are now directly placed in the manga-collection folder, 
         # we don't need to collect them again, just report the location
         if kobo and create_kobo_collection and results["successful"] > 0:
-            # Use specified collection_root or default to {output_dir}/manga-collection
-            root_dir = Path(collection_root) if collection_root else Path(output_dir) / "manga-collection"
-            kobo_dir = root_dir / sanitize_filename(manga_title.replace('_', ' '))
-            
-            # Just record the collection info for reporting
-            kobo_files = list(kobo_dir.glob("*.kepub.epub"))
+            # Just record the collection info for reporting; the files were
+            # tracked as they were copied, so there is no need to rescan
+            kobo_files = kobo_collection_files
             count = len(kobo_files)
             
             if count > 0:
@@ -401,7 +614,7 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
                     "manga_title": manga_title,
                     "kobo_dir": str(kobo_dir),
                     "collection_root": str(root_dir),
-                    "files": [{"source": str(f), "destination": str(f), "success": True} for f in kobo_files]
+                    "files": [{"source": f, "destination": f, "success": True} for f in kobo_files]
                 }
             else:
                 print_warning(f"No Kobo files found in {kobo_dir}")
@@ -420,12 +633,10 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
         error = error_handler.handle(e, category=ErrorCategory.UNEXPECTED)
         error_handler.display_error(error)
         logger.error(f"Error in process_manga workflow: {e}")
+        results["error"] = str(e)
         
         # Calculate end time even on error
-        end_time = datetime.now()
-        elapsed_time = end_time - start_time
-        results["completed_at"] = str(end_time)
-        results["elapsed_seconds"] = elapsed_time.total_seconds()
+        record_completion()
         
         return results
     
@@ -433,6 +644,8 @@ async def process_manga(manga_id: str, manga_title: str, volumes: List[str],
         # Always ensure resources are properly cleaned up
         if 'downloader' in locals():
             await downloader.close()
+        if 'image_pool' in locals():
+            image_pool.shutdown()
             
         # Note: Don't try to access exception variables here
     
@@ -470,9 +683,11 @@ def display_results_summary(results: Dict[str, Any]) -> None:
     if results.get("validation_results"):
         click.echo("\n🔍 Validation Results:")
         
-        valid_count = sum(1 for r in results["validation_results"].values() if r.get("valid") is True)
-        invalid_count = sum(1 for r in results["validation_results"].values() if r.get("valid") is False)
-        skipped_count = sum(1 for r in results["validation_results"].values() if r.get("valid") is None)
+        # One pass over the results; "valid" is True, False or None (not validated)
+        outcomes = Counter(r.get("valid") for r in results["validation_results"].values())
+        valid_count = outcomes[True]
+        invalid_count = outcomes[False]
+        skipped_count = outcomes[None]
         
         click.echo(f"- Valid: {valid_count}")
         click.echo(f"- Invalid: {invalid_count}")
@@ -494,6 +709,16 @@ def display_results_summary(results: Dict[str, Any]) -> None:
     click.echo("="*60)
 
 
+@functools.lru_cache(maxsize=1)
+def _find_epubcheck() -> Optional[str]:
+    """Locate the epubcheck executable once per process.
+    
+    Returns:
+        Optional[str]: Path to epubcheck, or None if it is not installed.
+    """
+    return shutil.which("epubcheck")
+
+
 async def validate_epub(epub_path: Union[str, Path]) -> Dict[str, Any]:
     """Validate an EPUB file using epubcheck if available.
     
@@ -512,33 +737,35 @@ async def validate_epub(epub_path: Union[str, Path]) -> Dict[str, Any]:
         }
     
     # Check if epubcheck is available
-    epubcheck_path = shutil.which("epubcheck")
+    epubcheck_path = _find_epubcheck()
     if not epubcheck_path:
         return {
             "valid": None,  # None means validation was not performed
             "error": "EpubCheck not found in PATH"
         }
     
-    # Run epubcheck
+    # Run epubcheck without blocking the event loop, so several
+    # validations can run side by side
     try:
-        import subprocess
-        process = subprocess.run(
-            ["epubcheck", str(epub_path)],
-            capture_output=True,
-            text=True,
-            check=False
+        process = await asyncio.create_subprocess_exec(
+            epubcheck_path, str(epub_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
         )
+        stdout, stderr = await process.communicate()
+        stdout = stdout.decode(errors="replace")
+        stderr = stderr.decode(errors="replace")
         
         if process.returncode == 0:
             return {
                 "valid": True,
-                "output": process.stdout
+                "output": stdout
             }
         else:
             return {
                 "valid": False,
-                "error": process.stderr,
-                "output": process.stdout
+                "error": stderr,
+                "output": stdout
             }
     except Exception as e:
         return {
@@ -561,7 +788,6 @@ def check_disk_space(path: Union[str, Path], required_mb: float = 100.0) -> Dict
     
     try:
         # Get disk usage statistics
-        import shutil
         usage = shutil.disk_usage(path)
         
         # Convert to MB
@@ -588,6 +814,58 @@ def check_disk_space(path: Union[str, Path], required_mb: float = 100.0) -> Dict
         }
 
 
+# Python dependencies to report, by import name, with the distributions
+# that can provide them (Pillow-SIMD installs as PIL too)
+_DEPENDENCY_DISTRIBUTIONS = {
+    "ebooklib": ("EbookLib",),
+    "PIL": ("Pillow", "Pillow-SIMD"),
+    "click": ("click",),
+    "tqdm": ("tqdm",),
+    "requests": ("requests",),
+    "aiohttp": ("aiohttp",),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _dependency_status(package: str) -> Tuple[bool, Optional[str]]:
+    """Check whether a package is installed without importing it.
+    
+    Args:
+        package: Import name of the package.
+        
+    Returns:
+        Tuple[bool, Optional[str]]: Whether it is installed, and its version if known.
+    """
+    if find_spec(package.split(".")[0]) is None:
+        return False, None
+    
+    for distribution in _DEPENDENCY_DISTRIBUTIONS.get(package, ()):
+        try:
+            return True, metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            continue
+    return True, None
+
+
+def _probe_dependencies() -> Dict[str, Dict[str, Any]]:
+    """Report the installation status of every known dependency.
+    
+    Returns:
+        Dict mapping each package to its status.
+    """
+    dependencies = {}
+    for package in _DEPENDENCY_DISTRIBUTIONS:
+        installed, version = _dependency_status(package)
+        if installed:
+            dependencies[package] = {
+                "installed": True,
+                "version": version
+            }
+        else:
+            dependencies[package] = {"installed": False}
+    return dependencies
+
+
 async def check_environment() -> Dict[str, Any]:
     """Check the environment for tools and dependencies.
     
@@ -608,13 +886,10 @@ async def check_environment() -> Dict[str, Any]:
             "path": tool_path
         }
     
-    # Check Python dependencies
-    for package in ["ebooklib", "PIL", "click", "tqdm", "requests", "aiohttp"]:
-        try:
-            __import__(package.split(".")[0])  # Import the top-level package
-            environment["dependencies"][package] = {"installed": True}
-        except ImportError:
-            environment["dependencies"][package] = {"installed": False}
+    # Check Python dependencies; the finder and metadata lookups touch the
+    # filesystem, so do them all in one trip to a worker thread
+    loop = asyncio.get_running_loop()
+    environment["dependencies"] = await loop.run_in_executor(None, _probe_dependencies)
     
     # Test API connectivity
     try:
@@ -633,9 +908,114 @@ async def check_environment() -> Dict[str, Any]:
     return environment
 
 
+def _volume_number(name: str) -> Optional[str]:
+    """Extract the number after "volume" in a name, as _VOLUME_RE does.
+    
+    A plain string scan; falls back to the regex in the rare case where
+    lowercasing changes the length of the name.
+    
+    Args:
+        name: File or directory name.
+        
+    Returns:
+        Optional[str]: The volume number digits, or None if there are none.
+    """
+    lowered = name.lower()
+    if len(lowered) != len(name):
+        match = _VOLUME_RE.search(name)
+        return match.group(1) if match else None
+    
+    end = len(name)
+    start = lowered.find("volume")
+    while start >= 0:
+        # Skip separators, then take the run of digits
+        i = start + 6
+        while i < end and (name[i] in "_-" or name[i].isspace()):
+            i += 1
+        j = i
+        while j < end and name[j].isdecimal():
+            j += 1
+        if j > i:
+            return name[i:j]
+        start = lowered.find("volume", start + 1)
+    return None
+
+
+def _collect_kobo_file(kepub_file: str, dest_path: str, create_symlinks: bool,
+                       create_hardlinks: bool) -> bool:
+    """Copy or link one kepub file into the Kobo collection.
+    
+    Args:
+        kepub_file: Source .kepub.epub file.
+        dest_path: Destination path inside the collection.
+        create_symlinks: Whether to create a symlink instead of copying.
+        create_hardlinks: Whether to hardlink instead of copying when both
+                          paths are on the same filesystem.
+        
+    Returns:
+        bool: False if the destination was already up to date and left alone.
+    """
+    if create_symlinks:
+        # Create a symbolic link under a temporary name and rename it over
+        # the destination, replacing any existing file atomically
+        tmp_path = f"{dest_path}.tmp{os.getpid()}"
+        try:
+            os.symlink(kepub_file, tmp_path)
+        except FileExistsError:
+            os.unlink(tmp_path)
+            os.symlink(kepub_file, tmp_path)
+        os.replace(tmp_path, dest_path)
+        logger.debug("Created symbolic link: %s -> %s", dest_path, kepub_file)
+        return True
+    
+    # Leave the destination alone if it is the same file, or a copy made
+    # by copy2 (same size and modification time)
+    try:
+        src_stat = os.stat(kepub_file)
+        # lstat, so a symlink left by symlink mode is replaced with a real file
+        dest_stat = os.lstat(dest_path)
+    except FileNotFoundError:
+        pass
+    else:
+        if (src_stat.st_ino == dest_stat.st_ino and src_stat.st_dev == dest_stat.st_dev) or (
+                src_stat.st_size == dest_stat.st_size
+                and src_stat.st_mtime_ns == dest_stat.st_mtime_ns):
+            logger.debug("Up to date: %s", dest_path)
+            return False
+    
+    if create_hardlinks:
+        # A hardlink shares the file's data, so nothing is copied. Link under
+        # a temporary name and rename it over the destination so there is
+        # never a moment without a file.
+        tmp_path = f"{dest_path}.tmp{os.getpid()}"
+        try:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            os.link(kepub_file, tmp_path)
+            os.replace(tmp_path, dest_path)
+            logger.debug("Linked: %s -> %s", kepub_file, dest_path)
+            return True
+        except OSError as e:
+            # Different filesystem or no hardlink support; fall back to copying
+            logger.debug("Hardlink failed for %s (%s), copying instead", kepub_file, e)
+    
+    # Copy to a temporary name and rename it over the destination, so an
+    # interrupted copy never leaves a truncated kepub in the collection
+    tmp_path = f"{dest_path}.tmp{os.getpid()}"
+    try:
+        shutil.copy2(kepub_file, tmp_path)
+        os.replace(tmp_path, dest_path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+    logger.debug("Copied: %s -> %s", kepub_file, dest_path)
+    return True
+
+
 async def collect_kobo_files(output_dir: Union[str, Path], manga_title: str, 
                         create_symlinks: bool = False, 
-                        collection_root: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+                        collection_root: Optional[Union[str, Path]] = None,
+                        create_hardlinks: bool = True) -> Dict[str, Any]:
     """Collect all .kepub.epub files for a manga into a canonical folder structure.
     
     Creates a folder structure like:
@@ -650,6 +1030,8 @@ async def collect_kobo_files(output_dir: Union[str, Path], manga_title: str,
         create_symlinks: Whether to create symlinks instead of copying files.
         collection_root: Root directory for the manga collection. If not specified,
                          will use '{output_dir}/manga-collection' as the root directory.
+        create_hardlinks: Whether to hardlink files instead of copying them when the
+                          collection is on the same filesystem (ignored with symlinks).
         
     Returns:
         Dict with results of the collection process.
@@ -657,9 +1039,18 @@ async def collect_kobo_files(output_dir: Union[str, Path], manga_title: str,
     output_dir = Path(output_dir)
     safe_manga_name = sanitize_filename(manga_title)
     manga_dir = output_dir / safe_manga_name
+    # Use manga title with spaces instead of underscores for better readability
+    readable_manga_name = manga_title.replace('_', ' ')
     
     # Find all volume directories
-    volume_dirs = list(manga_dir.glob("volume_*"))
+    try:
+        with os.scandir(manga_dir) as entries:
+            volume_dirs = [
+                entry for entry in entries
+                if entry.name.startswith("volume_") and entry.is_dir(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        volume_dirs = []
     if not volume_dirs:
         logger.warning(f"No volume directories found for manga '{manga_title}'")
         return {"success": False, "message": "No volume directories found"}
@@ -672,67 +1063,79 @@ async def collect_kobo_files(output_dir: Union[str, Path], manga_title: str,
         collection_root = output_dir / "manga-collection"
         
     # Create manga-specific directory inside the collection root
-    kobo_dir = collection_root / sanitize_filename(manga_title.replace('_', ' '))
+    kobo_dir = collection_root / sanitize_filename(readable_manga_name)
     ensure_directory(kobo_dir)
+    kobo_dir_str = os.fspath(kobo_dir)
     
     results = {
         "manga_title": manga_title,
         "kobo_dir": str(kobo_dir),
         "collection_root": str(collection_root),
         "files": [],
+        "skipped_count": 0,
         "success": True
     }
     
     # Find all .kepub.epub files in volume directories
+    dest_prefix = f"{readable_manga_name} - Volume "
+    transfers = []
     for volume_dir in volume_dirs:
-        kepub_files = list(volume_dir.glob("*.kepub.epub"))
-        for kepub_file in kepub_files:
-            # Extract volume number from the filename or directory name
-            # First try to get it from the filename
-            import re
-            volume_match = re.search(r'volume[_\s-]*(\d+)', kepub_file.stem, re.IGNORECASE)
-            
-            if not volume_match:
-                # Try to extract from the directory name
-                volume_match = re.search(r'volume[_\s-]*(\d+)', volume_dir.name, re.IGNORECASE)
-                
-            volume_num = volume_match.group(1) if volume_match else "unknown"
+        with os.scandir(volume_dir.path) as entries:
+            kepub_files = [
+                entry for entry in entries
+                if entry.name.endswith(".kepub.epub") and entry.is_file(follow_symlinks=False)
+            ]
+        # The directory name ("volume_003") nearly always carries the number,
+        # so parse it once per directory rather than once per file
+        dir_volume_num = _volume_number(volume_dir.name)
+        for kepub_entry in kepub_files:
+            # Fall back to the filename only if the directory name had no number
+            volume_num = (
+                dir_volume_num
+                or _volume_number(kepub_entry.name.rsplit('.', 1)[0])
+                or "unknown"
+            )
             
             # Create a nicely formatted destination filename
-            # Use manga title with spaces instead of underscores for better readability
-            readable_manga_name = manga_title.replace('_', ' ')
-            dest_filename = f"{readable_manga_name} - Volume {volume_num}.kepub.epub"
-            dest_path = kobo_dir / dest_filename
-            
+            dest_filename = dest_prefix + volume_num + ".kepub.epub"
+            transfers.append((kepub_entry.path, os.path.join(kobo_dir_str, dest_filename)))
+    
+    # Copies are I/O-bound, so run them side by side off the event loop.
+    # Transfers that share a destination still run in order, last one wins.
+    transfers_by_dest: Dict[str, List[int]] = {}
+    for index, (_, dest_path) in enumerate(transfers):
+        transfers_by_dest.setdefault(dest_path, []).append(index)
+    
+    # Result entries are filled in place so they keep the transfer order
+    entries: List[Dict[str, Any]] = [{} for _ in transfers]
+    loop = asyncio.get_running_loop()
+    
+    async def run_transfers(indices: List[int]) -> None:
+        for index in indices:
+            kepub_file, dest_path = transfers[index]
+            entry = entries[index]
+            entry["source"] = kepub_file
+            entry["destination"] = dest_path
             try:
-                if create_symlinks:
-                    # Create a symbolic link
-                    if dest_path.exists():
-                        dest_path.unlink()
-                    os.symlink(kepub_file, dest_path)
-                    logger.info(f"Created symbolic link: {dest_path} -> {kepub_file}")
-                else:
-                    # Copy the file
-                    shutil.copy2(kepub_file, dest_path)
-                    logger.info(f"Copied: {kepub_file} -> {dest_path}")
-                
-                results["files"].append({
-                    "source": str(kepub_file),
-                    "destination": str(dest_path),
-                    "success": True
-                })
+                transferred = await loop.run_in_executor(
+                    pool, _collect_kobo_file,
+                    kepub_file, dest_path, create_symlinks, create_hardlinks
+                )
+                entry["success"] = True
+                entry["skipped"] = not transferred
             except Exception as e:
                 logger.error(f"Error processing {kepub_file}: {e}")
-                results["files"].append({
-                    "source": str(kepub_file),
-                    "destination": str(dest_path),
-                    "success": False,
-                    "error": str(e)
-                })
+                entry["success"] = False
+                entry["error"] = str(e)
+    
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+        await asyncio.gather(*(run_transfers(indices) for indices in transfers_by_dest.values()))
+    
+    results["files"].extend(entries)
+    results["skipped_count"] = sum(1 for entry in entries if entry.get("skipped"))
     
     # Create a README file with instructions
-    from datetime import datetime
-    readme_content = f"""# Manga Collection for Kobo
+    readme_body = f"""# Manga Collection for Kobo
 
 This directory contains manga files organized by series for easy access on Kobo e-readers:
 
@@ -753,21 +1156,30 @@ This directory contains manga files organized by series for easy access on Kobo
 3. Safely disconnect your device
 4. The books will appear in your library automatically, organized by series
 
-Generated by MangaBook on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
     
-    # Create README in collection root
+    # Create README in collection root, unless one with the same
+    # instructions is already there (only the timestamp line would change)
     readme_path = collection_root / "README.md"
     try:
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        logger.info(f"Created README file: {readme_path}")
+        try:
+            existing_readme = readme_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            existing_readme = None
+        
+        if existing_readme is not None and existing_readme.startswith(readme_body):
+            logger.debug(f"README file up to date: {readme_path}")
+        else:
+            readme_content = readme_body + f"Generated by MangaBook on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            readme_path.write_text(readme_content, encoding='utf-8')
+            logger.info(f"Created README file: {readme_path}")
     except Exception as e:
         logger.error(f"Error creating README file: {e}")
     
     # Print summary
     if results["files"]:
-        logger.info(f"Collected {len(results['files'])} Kobo files for '{manga_title}' in {kobo_dir}")
+        logger.info(f"Collected {len(results['files'])} Kobo files for '{manga_title}' in {kobo_dir} "
+                    f"({results['skipped_count']} already up to date)")
     else:
         logger.warning(f"No .kepub.epub files found for '{manga_title}'")
         results["success"] = False
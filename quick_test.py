@@ -4,11 +4,10 @@
 Quick test for the enhanced EPUB builder
 """
 
-import os
 import sys
 from pathlib import Path
 import tempfile
-import shutil
+import subprocess
 
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -32,10 +31,13 @@ def main():
             # Write a minimal PNG file (just a header, not a valid image but enough for the test)
             f.write(bytes.fromhex('89504e470d0a1a0a0000000d49484452000000100000001008060000001ff3ff61'))
         
+        # Write the EPUB straight to a location outside the temp directory
+        output_dir = Path.home() / "src" / "mangabook"
+        
         # Create a builder
         builder = EnhancedEPUBBuilder(
             title="Test EPUB",
-            output_dir=temp_path,
+            output_dir=output_dir,
             language="en",
             author="Test Author"
         )
@@ -47,18 +49,14 @@ def main():
         builder.add_chapter("Chapter 1", "Chapter 1", [test_img_file])
         
         # Write EPUB
-        epub_path = builder.write("test_quick.epub")
-        print(f"Created EPUB: {epub_path}")
-        
-        # Copy the EPUB to a location outside the temp directory
-        output_dir = Path.home() / "src" / "mangabook"
-        output_path = output_dir / "test_quick.epub"
-        
-        shutil.copy(epub_path, output_path)
-        print(f"Copied EPUB to {output_path}")
+        output_path = builder.write("test_quick.epub", force_overwrite=True)
+        print(f"Created EPUB: {output_path}")
         
         print("Running epubcheck on the generated EPUB...")
-        os.system(f"epubcheck {output_path}")
+        try:
+            subprocess.run(["epubcheck", str(output_path)], check=False)
+        except FileNotFoundError:
+            print("epubcheck not found in PATH")
         
         print("Test completed successfully")
 